@@ -1,22 +1,86 @@
 import os
+import atexit
 import time
-from typing import Final, Optional, List, Dict, Tuple
+from typing import Callable, Final, Optional, List, Dict, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from tqdm import tqdm
+from tqdm.utils import CallbackIOWrapper
 import importlib.metadata
+from functools import lru_cache
 import concurrent.futures
 from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import json
+import re
 import shlex
+import shutil
 import subprocess
 import sys
+import tempfile
 import asyncio
 import websockets
 import threading
 from .spinner import Spinner
 import platform
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON for websocket messages
+    orjson = None
+
 ENGINE: Final = os.environ.get("TENSORPOOL_ENGINE", "https://engine.tensorpool.dev")
+# http(s):// -> ws(s)://, anchored to the scheme
+WS_ENGINE: Final = re.sub(r"^http", "ws", ENGINE)
+
+IGNORE_FILE_SUFFIXES: Final = {
+    "venv",
+    "__pycache__",
+    ".git",
+    ".idea",
+    ".vscode",
+    ".DS_Store",
+    ".pyc",
+    ".ipynb_checkpoints",
+    ".egg-info",
+    "node_modules",
+    "proj.tgz",
+}
+_IGNORE_SUFFIX_TUPLE: Final = tuple(IGNORE_FILE_SUFFIXES)
+_STREAM_READ_SIZE: Final = 64 * 1024
+DOWNLOAD_CHUNK_SIZE: Final = 1024 * 1024
+DEFAULT_DOWNLOAD_CONCURRENCY: Final = 16
+DEFAULT_MAX_CONCURRENCY: Final = 8
+HTTP_POOL_MAXSIZE: Final = 32
+RANGED_DOWNLOAD_THRESHOLD: Final = 128 * 1024 * 1024
+RANGED_DOWNLOAD_PARTS: Final = 8
+PUBLIC_KEY_MAX_BYTES: Final = 16 * 1024
+
+_PLATFORM_SYSTEM: Final = platform.system()
+
+CACHE_DIR: Final = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "tensorpool"
+)
+_EMPTY_TP_CONFIG_CACHE: Final = os.path.join(CACHE_DIR, "empty_tp_config.json")
+_EMPTY_TP_CONFIG_TTL: Final = 300
+# Oldest cached config still served when the engine cannot be reached
+_EMPTY_TP_CONFIG_MAX_STALE: Final = 24 * 60 * 60
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK: Final = threading.Lock()
+_EVENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_ASYNC_RUNNER = None  # asyncio.Runner on Python 3.11+
+# Matches any TENSORPOOL_KEY assignment, including blank ones; [ \t] rather than
+# \s so a blank value never runs on into the next line
+_ENV_KEY_RE: Final = re.compile(
+    r"^TENSORPOOL_KEY[ \t]*=[ \t]*[\"']?([^\"'\r\n]*)", re.MULTILINE
+)
+# (.env path, st_mtime_ns, parsed key)
+_ENV_KEY_CACHE: Optional[Tuple[str, int, Optional[str]]] = None
+# Identical read-only GETs that are currently in flight, shared between threads
+_INFLIGHT_GETS: Dict[tuple, concurrent.futures.Future] = {}
+_INFLIGHT_GETS_LOCK: Final = threading.Lock()
 
 
 def _run_streaming_command(
@@ -36,31 +100,32 @@ def _run_streaming_command(
         env=env,
     )
 
-    stdout_chunks: List[str] = []
-    stderr_chunks: List[str] = []
+    stdout_buf = bytearray()
+    stderr_buf = bytearray()
 
     def _drain_stream(stream, sink, target_stream=None):
         while True:
-            chunk = stream.read(1)
+            # Unbuffered pipe: read() returns whatever is available (up to the
+            # limit), so \r progress still streams with one write+flush per chunk
+            chunk = stream.read(_STREAM_READ_SIZE)
             if chunk == b"":
                 break
-            decoded_chunk = chunk.decode("utf-8", errors="replace")
-            sink.append(decoded_chunk)
+            sink += chunk
             if target_stream is not None:
                 if hasattr(target_stream, "buffer"):
                     target_stream.buffer.write(chunk)
                 else:
-                    target_stream.write(decoded_chunk)
+                    target_stream.write(chunk.decode("utf-8", errors="replace"))
                 target_stream.flush()
 
     stdout_thread = threading.Thread(
         target=_drain_stream,
-        args=(process.stdout, stdout_chunks, sys.stdout if show_stdout else None),
+        args=(process.stdout, stdout_buf, sys.stdout if show_stdout else None),
         daemon=True,
     )
     stderr_thread = threading.Thread(
         target=_drain_stream,
-        args=(process.stderr, stderr_chunks, sys.stderr if show_stdout else None),
+        args=(process.stderr, stderr_buf, sys.stderr if show_stdout else None),
         daemon=True,
     )
 
@@ -71,7 +136,144 @@ def _run_streaming_command(
     stdout_thread.join()
     stderr_thread.join()
 
-    return returncode, "".join(stdout_chunks), "".join(stderr_chunks)
+    # Decode once so multi-byte characters split across reads stay intact
+    return (
+        returncode,
+        stdout_buf.decode("utf-8", errors="replace"),
+        stderr_buf.decode("utf-8", errors="replace"),
+    )
+
+
+async def _run_streaming_command_async(
+    command: str, show_stdout: bool = False
+) -> Tuple[int, str, str]:
+    """
+    Async variant of _run_streaming_command for use inside websocket handlers.
+    Output is drained on the event loop, so keepalive pings keep being served
+    while the command runs.
+    """
+    env = os.environ.copy()
+    env["PYTHONUNBUFFERED"] = "1"
+
+    process = await asyncio.create_subprocess_shell(
+        command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        stdin=asyncio.subprocess.DEVNULL,
+        env=env,
+    )
+
+    stdout_buf = bytearray()
+    stderr_buf = bytearray()
+
+    async def _drain_stream(stream, sink, target_stream=None):
+        while True:
+            # read() returns whatever is available, so \r progress updates still stream
+            chunk = await stream.read(_STREAM_READ_SIZE)
+            if chunk == b"":
+                break
+            sink += chunk
+            if target_stream is not None:
+                if hasattr(target_stream, "buffer"):
+                    target_stream.buffer.write(chunk)
+                else:
+                    target_stream.write(chunk.decode("utf-8", errors="replace"))
+                target_stream.flush()
+
+    await asyncio.gather(
+        _drain_stream(
+            process.stdout, stdout_buf, sys.stdout if show_stdout else None
+        ),
+        _drain_stream(
+            process.stderr, stderr_buf, sys.stderr if show_stdout else None
+        ),
+    )
+    returncode = await process.wait()
+
+    # Decode once so multi-byte characters split across reads stay intact
+    return (
+        returncode,
+        stdout_buf.decode("utf-8", errors="replace"),
+        stderr_buf.decode("utf-8", errors="replace"),
+    )
+
+
+def _session() -> requests.Session:
+    """
+    Shared requests session so calls reuse keep-alive TCP/TLS connections.
+    Idempotent requests are retried on connection errors and transient gateway
+    errors, but not on read timeouts, so a hung server costs one timeout.
+    """
+    global _SESSION
+    # First use is often from download or batch worker threads
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                max_retries=Retry(
+                    total=3,
+                    read=0,
+                    backoff_factor=1,
+                    status_forcelist=[502, 503, 504],
+                    raise_on_status=False,
+                ),
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION = session
+        return _SESSION
+
+
+def _json_dumps(obj) -> str:
+    """Serialize a websocket message, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def _json_loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _run_async(coro):
+    """
+    Run a coroutine to completion on a process-wide event loop, rather than
+    creating and tearing down a new loop per call like asyncio.run does.
+    """
+    global _EVENT_LOOP, _ASYNC_RUNNER
+    if sys.version_info >= (3, 11):
+        if _ASYNC_RUNNER is None:
+            _ASYNC_RUNNER = asyncio.Runner()
+            atexit.register(_close_event_loop)
+        return _ASYNC_RUNNER.run(coro)
+
+    if _EVENT_LOOP is None or _EVENT_LOOP.is_closed():
+        _EVENT_LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_EVENT_LOOP)
+        atexit.register(_close_event_loop)
+    return _EVENT_LOOP.run_until_complete(coro)
+
+
+def _close_event_loop() -> None:
+    """Shut down the shared event loop at interpreter exit."""
+    global _EVENT_LOOP, _ASYNC_RUNNER
+    if _ASYNC_RUNNER is not None:
+        _ASYNC_RUNNER.close()
+        _ASYNC_RUNNER = None
+        return
+
+    if _EVENT_LOOP is None or _EVENT_LOOP.is_closed():
+        return
+    try:
+        _EVENT_LOOP.run_until_complete(_EVENT_LOOP.shutdown_asyncgens())
+    finally:
+        _EVENT_LOOP.close()
+        _EVENT_LOOP = None
 
 
 def safe_input(
@@ -145,27 +347,37 @@ def safe_confirm(prompt: str, no_input: bool = False, default: str = "y") -> str
 
 
 def _get_headers(
-    include_auth: bool = True, content_type: str = "application/json"
+    include_auth: bool = True, content_type: Optional[str] = "application/json"
 ) -> Dict[str, str]:
     """
     Get standard headers for API requests with X-Client-Type automatically included.
     Args:
         include_auth: Whether to include Authorization header (default True)
-        content_type: Content-Type header value (default "application/json")
+        content_type: Content-Type header value (default "application/json"), or
+            None to omit the header
     Returns:
-        Dictionary of headers with X-Client-Type: "cli" always included
+        Dictionary of headers with X-Client-Type: "cli" always included.
+        The dict is a fresh copy and safe to modify.
     """
-    headers = {
-        "X-Client-Type": "cli",
-        "Content-Type": content_type,
-    }
-
+    api_key = None
     if include_auth:
         api_key = get_tensorpool_key()
         assert api_key is not None, "TENSORPOOL_KEY not found. Please set your API key."
-        headers["Authorization"] = f"Bearer {api_key}"
 
-    return headers
+    return dict(_base_headers(api_key, content_type))
+
+
+@lru_cache(maxsize=8)
+def _base_headers(
+    api_key: Optional[str], content_type: Optional[str]
+) -> Tuple[Tuple[str, str], ...]:
+    """Build the header items for a key/content type pair once per process."""
+    headers = [("X-Client-Type", "cli")]
+    if content_type is not None:
+        headers.append(("Content-Type", content_type))
+    if api_key is not None:
+        headers.append(("Authorization", f"Bearer {api_key}"))
+    return tuple(headers)
 
 
 def get_tensorpool_key():
@@ -174,22 +386,73 @@ def get_tensorpool_key():
     if key:
         return key
 
+    return _read_env_file_key()
+
+
+def _read_env_file_key() -> Optional[str]:
+    """Read TENSORPOOL_KEY from .env in cwd, re-parsing only when the file changes"""
+    global _ENV_KEY_CACHE
+    env_path = os.path.join(os.getcwd(), ".env")
     try:
-        with open(os.path.join(os.getcwd(), ".env")) as f:
-            for line in f:
-                if line.startswith("TENSORPOOL_KEY"):
-                    return line.split("=", 1)[1].strip().strip("'").strip('"')
+        mtime_ns = os.stat(env_path).st_mtime_ns
+    except OSError:
+        return None
+
+    if _ENV_KEY_CACHE is not None and _ENV_KEY_CACHE[:2] == (env_path, mtime_ns):
+        return _ENV_KEY_CACHE[2]
+
+    try:
+        with open(env_path) as f:
+            match = _ENV_KEY_RE.search(f.read())
     except FileNotFoundError:
         return None
 
-    return None
+    key = (match.group(1).strip() or None) if match else None
+
+    _ENV_KEY_CACHE = (env_path, mtime_ns, key)
+    return key
+
+
+def _invalidate_key_cache() -> None:
+    """Forget the cached .env key so the next lookup re-reads the file"""
+    global _ENV_KEY_CACHE
+    _ENV_KEY_CACHE = None
 
 
 def save_tensorpool_key(api_key: str) -> bool:
     """Save API key to .env in current directory and set in environment"""
+    env_path = os.path.join(os.getcwd(), ".env")
     try:
-        with open(os.path.join(os.getcwd(), ".env"), "a+") as f:
-            f.write(f"\nTENSORPOOL_KEY={api_key}\n")
+        # Replace any previous key instead of appending another one
+        try:
+            with open(env_path) as f:
+                lines = [
+                    line
+                    for line in f.read().splitlines()
+                    if not _ENV_KEY_RE.match(line)
+                ]
+        except FileNotFoundError:
+            lines = []
+        lines.append(f"TENSORPOOL_KEY={api_key}")
+
+        # Write a sibling temp file and rename it over .env so a crash mid-write
+        # never leaves a truncated file behind
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w", dir=os.path.dirname(env_path), prefix=".env.", delete=False
+            ) as f:
+                tmp_path = f.name
+                f.write("\n".join(lines) + "\n")
+            if os.path.exists(env_path):
+                shutil.copymode(env_path, tmp_path)
+            os.replace(tmp_path, env_path)
+        except Exception:
+            # Never leave a stray copy of the key behind
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        _invalidate_key_cache()
         os.environ["TENSORPOOL_KEY"] = api_key
         assert os.getenv("TENSORPOOL_KEY") == api_key
         return True
@@ -212,6 +475,7 @@ def login(no_input: bool = False):
     return save_tensorpool_key(api_key)
 
 
+@lru_cache(maxsize=1)
 def get_version():
     try:
         return importlib.metadata.version(__package__)
@@ -219,6 +483,19 @@ def get_version():
         return "unknown"
 
 
+@lru_cache(maxsize=1)
+def _client_info() -> Dict:
+    """Package and interpreter details reported to the engine; fixed for the process."""
+    return {
+        "package_version": get_version(),
+        "uname": platform.uname(),
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "python_compiler": platform.python_compiler(),
+        "python_build": platform.python_build(),
+    }
+
+
 def health_check() -> (bool, str):
     """
     Checks if the TensorPool engine is online and if the package version is acceptable.
@@ -228,27 +505,15 @@ def health_check() -> (bool, str):
     """
 
     try:
-        version = get_version()
-        # print(f"Package version: {version}")
         headers = _get_headers()
-        response = requests.post(
+        response = _session().post(
             f"{ENGINE}/health",
-            json={
-                "package_version": version,
-                "uname": platform.uname(),
-                "python_version": platform.python_version(),
-                "python_implementation": platform.python_implementation(),
-                "python_compiler": platform.python_compiler(),
-                "python_build": platform.python_build(),
-            },
+            json=_client_info(),
             headers=headers,
             timeout=15,
         )
-        try:
-            data = response.json()
-        except requests.exceptions.JSONDecodeError:
-            # Malformed response handling
-            # print(response.text)
+        data, decode_error = _decode_response_json(response)
+        if decode_error:
             return (
                 False,
                 f"Received malformed response from server during health check. Status code: {response.status_code} \nIf this persists, please contact team@tensorpool.dev",
@@ -278,14 +543,19 @@ def _normalize_platform_system() -> str:
         "Windows": "windows",
         "Linux": "linux",
         "Darwin": "darwin",
-    }.get(platform.system(), platform.system().lower())
+    }.get(_PLATFORM_SYSTEM, _PLATFORM_SYSTEM.lower())
 
 
 def _decode_response_json(response: requests.Response) -> Tuple[Optional[Dict], Optional[str]]:
     """Decode a JSON response into a dict and surface malformed responses consistently."""
+    # Error pages from proxies (HTML 5xx etc.) are not worth a parse attempt
+    content_type = response.headers.get("Content-Type", "")
+    if not response.ok and content_type and "json" not in content_type:
+        return None, f"Failed to decode server response. Status code: {response.status_code}"
+
     try:
-        data = response.json()
-    except requests.exceptions.JSONDecodeError:
+        data = _json_loads(response.content)
+    except ValueError:
         return None, f"Failed to decode server response. Status code: {response.status_code}"
 
     if not isinstance(data, dict):
@@ -313,6 +583,79 @@ def _response_message(
     return default
 
 
+def _get_json(
+    path: str,
+    *,
+    error_prefix: str,
+    params: Optional[Dict] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> Tuple[bool, str]:
+    """
+    GET a read-only engine endpoint and return its "message" field.
+
+    Concurrent calls for the same path, params and headers (e.g. from batch_ops)
+    share a single request instead of each hitting the engine.
+    Args:
+        path: Endpoint path appended to ENGINE
+        error_prefix: Describes the operation in error messages, e.g. "Error listing jobs"
+        params: Optional query parameters
+        headers: Request headers, defaulting to the authenticated JSON headers
+    Returns:
+        A tuple containing a boolean indicating success and a message
+    """
+    if headers is None:
+        headers = _get_headers()
+
+    key = (path, tuple(sorted((params or {}).items())), tuple(sorted(headers.items())))
+    with _INFLIGHT_GETS_LOCK:
+        future = _INFLIGHT_GETS.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = concurrent.futures.Future()
+            _INFLIGHT_GETS[key] = future
+
+    if not is_owner:
+        return future.result()
+
+    try:
+        result = _fetch_get_json(path, error_prefix, params, headers)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+    finally:
+        with _INFLIGHT_GETS_LOCK:
+            del _INFLIGHT_GETS[key]
+    return result
+
+
+def _fetch_get_json(
+    path: str, error_prefix: str, params: Optional[Dict], headers: Dict[str, str]
+) -> Tuple[bool, str]:
+    """Issue the GET behind _get_json and reduce the response to (success, message)."""
+    try:
+        response = _session().get(
+            f"{ENGINE}{path}",
+            params=params,
+            headers=headers,
+            timeout=30,
+        )
+    except requests.exceptions.RequestException as e:
+        return False, f"{error_prefix}: {str(e)}"
+
+    result, decode_error = _decode_response_json(response)
+    if decode_error:
+        return False, decode_error
+
+    if response.status_code != 200:
+        return False, result.get(
+            "message", f"{error_prefix}. Status code: {response.status_code}"
+        )
+
+    return True, result.get("message", "")
+
+
 def _confirm_destructive_action(action: str, target: str, no_input: bool) -> Tuple[bool, str]:
     """Confirm a destructive action locally before calling the API."""
     if no_input:
@@ -334,7 +677,7 @@ def _poll_request_until_terminal(
     """Poll a request resource until it reaches a terminal state."""
     while True:
         try:
-            response = requests.get(
+            response = _session().get(
                 f"{ENGINE}/request/info/{request_id}",
                 headers=headers,
                 timeout=30,
@@ -399,7 +742,7 @@ def _poll_job_cancel_until_terminal(
     """Poll job info until cancellation reaches a terminal state."""
     while True:
         try:
-            response = requests.get(
+            response = _session().get(
                 f"{ENGINE}/job/info/{job_id}",
                 headers=headers,
                 timeout=30,
@@ -454,37 +797,112 @@ def get_proj_paths():
     Returns a list of all file paths in the project directory.
     """
     # TODO: make this use shouldignore
-    files = [
-        os.path.normpath(os.path.join(dirpath, f))
-        for (dirpath, dirnames, filenames) in os.walk(".")
-        if not any(i in dirpath for i in IGNORE_FILE_SUFFIXES)
-        for f in filenames
-        if not any(f.endswith(i) for i in IGNORE_FILE_SUFFIXES)
-    ]
+    files = []
+    # Ignored directories are pruned before descending into them
+    stack = ["."]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        if entry.is_symlink():
+                            continue
+                        if not entry.name.endswith(_IGNORE_SUFFIX_TUPLE):
+                            stack.append(entry.path)
+                    elif not entry.name.endswith(_IGNORE_SUFFIX_TUPLE):
+                        files.append(os.path.normpath(entry.path))
+        except OSError:
+            continue
 
     return files
 
 
+def _empty_tp_config_cache_tag(headers: Dict[str, str]) -> str:
+    """Identify the engine and account a cached job/init response belongs to."""
+    return hashlib.sha256(
+        f"{ENGINE}\0{headers.get('Authorization', '')}".encode("utf-8")
+    ).hexdigest()
+
+
+def _read_empty_tp_config_cache(tag: str) -> Optional[Dict]:
+    """Load the cached job/init response for this engine and account, if any."""
+    try:
+        with open(_EMPTY_TP_CONFIG_CACHE, "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(cached, dict)
+        or cached.get("tag") != tag
+        or not isinstance(cached.get("ts"), (int, float))
+        or not cached.get("config")
+    ):
+        return None
+
+    return cached
+
+
+def _write_empty_tp_config_cache(
+    tag: str, empty_tp_config, message: Optional[str]
+) -> None:
+    """Atomically store a job/init response; cache failures are not fatal."""
+    tmp_path = None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=CACHE_DIR, suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            json.dump(
+                {
+                    "tag": tag,
+                    "ts": time.time(),
+                    "config": empty_tp_config,
+                    "message": message,
+                },
+                f,
+            )
+        os.replace(tmp_path, _EMPTY_TP_CONFIG_CACHE)
+    except OSError:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def get_empty_tp_config() -> Tuple[bool, Optional[Dict], Optional[str]]:
     """
-    Fetch the default empty tp config from the job/init endpoint
+    Fetch the default empty tp config from the job/init endpoint.
+    Responses are cached on disk per engine and API key for _EMPTY_TP_CONFIG_TTL
+    seconds, and a cached config up to _EMPTY_TP_CONFIG_MAX_STALE seconds old is
+    used if the engine cannot be reached.
     Returns:
         A tuple containing success status, empty config dict, and optional message
     """
+    # Resolve the key first so a cache hit never stands in for a missing login
     headers = _get_headers()
+    cache_tag = _empty_tp_config_cache_tag(headers)
+
+    cached = _read_empty_tp_config_cache(cache_tag)
+    cache_age = time.time() - cached["ts"] if cached else None
+    if cached and cache_age < 0:
+        # Written in the future (clock change); don't trust it
+        cached = None
+    if cached and cache_age < _EMPTY_TP_CONFIG_TTL:
+        return True, cached["config"], cached.get("message")
 
     try:
-        response = requests.get(
+        response = _session().get(
             f"{ENGINE}/job/init",
             headers=headers,
             timeout=30,
         )
     except requests.exceptions.RequestException as e:
+        if cached and cache_age < _EMPTY_TP_CONFIG_MAX_STALE:
+            return True, cached["config"], "Could not reach TensorPool, using cached config"
         return False, None, f"Failed to fetch empty config: {str(e)}"
 
-    try:
-        res = response.json()
-    except requests.exceptions.JSONDecodeError:
+    res, decode_error = _decode_response_json(response)
+    if decode_error:
         return False, None, "Received malformed response from server"
 
     if response.status_code != 200:
@@ -497,6 +915,8 @@ def get_empty_tp_config() -> Tuple[bool, Optional[Dict], Optional[str]]:
     if not empty_tp_config:
         return False, None, "No empty config received from server"
 
+    _write_empty_tp_config_cache(cache_tag, empty_tp_config, message)
+
     return True, empty_tp_config, message
 
 
@@ -518,7 +938,7 @@ def job_listen(job_id: str) -> Tuple[bool, str]:
     # payload = {}
 
     # Run the async function without a spinner so messages print directly
-    success, message = asyncio.run(
+    success, message = _run_async(
         _ws_operation_async(
             endpoint=endpoint,
             spinner=None,
@@ -542,34 +962,38 @@ async def _job_push_async(
     cluster_id: str,
     teardown_cluster: bool = False,
 ) -> Tuple[bool, Optional[str]]:
-    ws_url = (
-        f"{ENGINE.replace('http://', 'ws://').replace('https://', 'wss://')}/job/push"
-    )
+    ws_url = f"{WS_ENGINE}/job/push"
     # print("ws_url:", ws_url)
 
     job_id = None
 
     try:
+        # Frames carry full command output: keep per-message deflate and allow
+        # larger messages than the 1 MiB default
         async with websockets.connect(
-            ws_url, ping_interval=5, ping_timeout=10
+            ws_url,
+            ping_interval=5,
+            ping_timeout=10,
+            compression="deflate",
+            max_size=32 * 1024 * 1024,
         ) as websocket:
             # First message: Send API key
-            await websocket.send(json.dumps({"TENSORPOOL_KEY": api_key}))
+            await websocket.send(_json_dumps({"TENSORPOOL_KEY": api_key}))
 
             # Second message: Send job configuration
             initial_data = {
                 "tp_config": tp_config,
-                "system": platform.system(),
+                "system": _PLATFORM_SYSTEM,
                 "cluster_id": cluster_id,
                 "teardown_cluster": teardown_cluster,
             }
 
-            await websocket.send(json.dumps(initial_data))
+            await websocket.send(_json_dumps(initial_data))
 
             # Process messages from server
             while True:
                 message = await websocket.recv()
-                data = json.loads(message)
+                data = _json_loads(message)
                 # print("recieved data:", data)
 
                 # Capture job_id if present
@@ -589,7 +1013,7 @@ async def _job_push_async(
 
                     show_stdout = data.get("command_show_stdout", False)
                     try:
-                        returncode, stdout, stderr = _run_streaming_command(
+                        returncode, stdout, stderr = await _run_streaming_command_async(
                             command, show_stdout=show_stdout
                         )
 
@@ -616,7 +1040,7 @@ async def _job_push_async(
                         "command_stdout": stdout,
                         "command_stderr": stderr,
                     }
-                    await websocket.send(json.dumps(response))
+                    await websocket.send(_json_dumps(response))
 
     except websockets.exceptions.ConnectionClosed as e:
         # Code 1000 is normal/successful closure
@@ -678,7 +1102,7 @@ def job_push(
         return False, None
 
     # Run the async function
-    return asyncio.run(
+    return _run_async(
         _job_push_async(
             tp_config,
             api_key,
@@ -725,20 +1149,15 @@ def job_pull(
         params["private_key_path"] = tensorpool_priv_key_path
 
     try:
-        response = requests.get(
+        response = _session().get(
             f"{ENGINE}/job/pull/{job_id}", params=params, headers=headers, timeout=60
         )
     except requests.exceptions.RequestException as e:
         return None, f"Failed to pull job: {str(e)}"
 
-    try:
-        result = response.json()
-        # print(result)
-    except requests.exceptions.JSONDecodeError:
-        return (
-            None,
-            f"Failed to decode server response. Status code: {response.status_code}",
-        )
+    result, decode_error = _decode_response_json(response)
+    if decode_error:
+        return None, decode_error
 
     if response.status_code != 200:
         error_msg = result.get(
@@ -782,13 +1201,121 @@ def job_pull(
     return download_map, message
 
 
+def _progress_enabled() -> bool:
+    """Show progress bars only on an interactive stderr, unless TENSORPOOL_NO_PROGRESS is set."""
+    return sys.stderr.isatty() and not os.environ.get("TENSORPOOL_NO_PROGRESS")
+
+
+def _supports_ranged_download(response: requests.Response, total_size: int) -> bool:
+    """Whether a download is large enough, and served in a way, to split into ranges."""
+    return (
+        total_size >= RANGED_DOWNLOAD_THRESHOLD
+        and response.headers.get("Accept-Ranges", "").lower() == "bytes"
+        and not response.headers.get("Content-Encoding")
+    )
+
+
+def _download_file_ranges(
+    url: str,
+    file_path: str,
+    total_size: int,
+    headers: Dict[str, str],
+    on_progress,
+    parts: int = RANGED_DOWNLOAD_PARTS,
+) -> bool:
+    """
+    Download url into file_path as up to parts concurrent byte ranges.
+    Each part writes at its own offset of a preallocated file, so a single large
+    file is not limited to one TCP stream.
+    Returns:
+        False if the server ignored the Range header, in which case the caller
+        should fall back to a single stream. Raises on any other failed or short part.
+    """
+    with open(file_path, "wb") as f:
+        f.truncate(total_size)
+
+    part_size = -(-total_size // parts)
+    ranges = [
+        (start, min(start + part_size, total_size) - 1)
+        for start in range(0, total_size, part_size)
+    ]
+
+    # Parts share one progress bar, and tqdm's update is not thread-safe
+    progress_lock = threading.Lock()
+
+    def _report(n):
+        with progress_lock:
+            on_progress(n)
+
+    def _fetch_range(byte_range):
+        start, end = byte_range
+        range_headers = dict(headers, Range=f"bytes={start}-{end}")
+        # Plain requests.get: parts get their own connections instead of
+        # overflowing the shared session pool used by the per-file workers
+        with requests.get(url, headers=range_headers, stream=True, timeout=60) as response:
+            if response.status_code == 200:
+                # Accept-Ranges was advertised but Range ignored
+                return False
+            if response.status_code != 206:
+                raise IOError(
+                    f"Ranged download returned status {response.status_code}"
+                )
+            with open(file_path, "r+b") as f:
+                f.seek(start)
+                shutil.copyfileobj(
+                    CallbackIOWrapper(_report, response.raw, "read"),
+                    f,
+                    DOWNLOAD_CHUNK_SIZE,
+                )
+                if f.tell() != end + 1:
+                    raise IOError(f"Incomplete ranged download of bytes {start}-{end}")
+        return True
+
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        return all(
+            future.result()
+            for future in concurrent.futures.as_completed(
+                [executor.submit(_fetch_range, byte_range) for byte_range in ranges]
+            )
+        )
+
+
+def _wire_progress(raw, on_progress: Callable[[int], object]) -> Callable[[int], None]:
+    """
+    Wrap a progress callback to count bytes read off the wire rather than decoded
+    bytes, so compressed responses stay in step with their content-length.
+    """
+    last = 0
+
+    def _update(_decoded_len: int) -> None:
+        nonlocal last
+        pos = raw.tell()
+        on_progress(pos - last)
+        last = pos
+
+    return _update
+
+
 def download_files(download_map: Dict[str, str], overwrite: bool = False) -> bool:
     """
     Given a download map of file paths to signed GET URLs, download each file in parallel.
     If the same files exists locally, append a suffix to the filename.
     """
 
-    max_workers = min(os.cpu_count() * 2 if os.cpu_count() else 6, 6)
+    # Downloads are network-bound, so size the pool by file count rather than CPUs
+    try:
+        max_workers = int(
+            os.environ.get(
+                "TENSORPOOL_DOWNLOAD_CONCURRENCY", DEFAULT_DOWNLOAD_CONCURRENCY
+            )
+        )
+    except ValueError:
+        max_workers = DEFAULT_DOWNLOAD_CONCURRENCY
+    # Stay within the session's connection pool so every worker keeps its connection
+    max_workers = max(1, min(max_workers, len(download_map), HTTP_POOL_MAXSIZE))
+    # Ranged parts open their own connections; split large files into fewer parts
+    # when several files download at once so the total stays near HTTP_POOL_MAXSIZE
+    range_parts = min(RANGED_DOWNLOAD_PARTS, HTTP_POOL_MAXSIZE // max_workers)
     successes = []
     failures = []
 
@@ -800,41 +1327,89 @@ def download_files(download_map: Dict[str, str], overwrite: bool = False) -> boo
             max_retries = 3
             base_delay = 1
 
+            # Decide before any network work so already-pulled files cost nothing
+            if os.path.exists(file_path):
+                if overwrite:
+                    print(f"Overwriting {file_path}")
+                else:
+                    print(f"Skipping {file_path} - file already exists")
+                    return True, (file_path, 200, "Skipped - file exists")
+
+            # Set once file_path has been opened for writing by this call
+            file_started = False
+
+            def _discard_partial():
+                # Don't leave a partial or preallocated file that a later
+                # pull would skip as already downloaded
+                if file_started:
+                    try:
+                        os.remove(file_path)
+                    except OSError:
+                        pass
+
+            # The session already retries connection errors and 5xx replies with
+            # backoff, so this loop only retries transfers that fail mid-body
             for retries in range(max_retries + 1):
                 try:
-                    response = requests.get(url, headers=headers, stream=True)
-                    if response.status_code != 200:
-                        if retries < max_retries:
-                            delay = base_delay * (2**retries)
-                            time.sleep(delay)
-                            continue
-                        return False, (file_path, response.status_code, response.text)
+                    response = _session().get(url, headers=headers, stream=True)
+                except requests.exceptions.RequestException as e:
+                    _discard_partial()
+                    return False, (file_path, "Exception", str(e))
+                if response.status_code != 200:
+                    _discard_partial()
+                    return False, (file_path, response.status_code, response.text)
 
+                try:
                     total_size = int(response.headers.get("content-length", 0))
 
-                    if os.path.exists(file_path):
-                        if overwrite:
-                            print(f"Overwriting {file_path}")
-                        else:
-                            print(f"Skipping {file_path} - file already exists")
-                            return True, (file_path, 200, "Skipped - file exists")
-
                     # Create directories for path if they don't exist
                     dir_name = os.path.dirname(file_path)
                     if dir_name:
                         os.makedirs(dir_name, exist_ok=True)
 
-                    with open(file_path, "wb") as f:
-                        with tqdm(
-                            total=total_size,
-                            unit="B",
-                            unit_scale=True,
-                            desc=f"Downloading {os.path.basename(file_path)}{' (attempt ' + str(retries + 1) + ')' if retries > 0 else ''}",
-                        ) as pbar:
-                            for chunk in response.iter_content(chunk_size=8192):
-                                if chunk:
-                                    f.write(chunk)
-                                    pbar.update(len(chunk))
+                    with tqdm(
+                        total=total_size,
+                        unit="B",
+                        unit_scale=True,
+                        disable=not _progress_enabled(),
+                        desc=f"Downloading {os.path.basename(file_path)}{' (attempt ' + str(retries + 1) + ')' if retries > 0 else ''}",
+                    ) as pbar:
+                        file_started = True
+                        ranged = range_parts > 1 and _supports_ranged_download(
+                            response, total_size
+                        )
+                        if ranged:
+                            response.close()
+                            ranged = _download_file_ranges(
+                                url,
+                                file_path,
+                                total_size,
+                                headers,
+                                pbar.update,
+                                parts=range_parts,
+                            )
+                            if not ranged:
+                                pbar.reset()
+                                response = _session().get(
+                                    url, headers=headers, stream=True
+                                )
+                                if response.status_code != 200:
+                                    raise IOError(
+                                        f"Download returned status {response.status_code}"
+                                    )
+                        if not ranged:
+                            with open(file_path, "wb") as f:
+                                # Undo any Content-Encoding, matching iter_content
+                                response.raw.decode_content = True
+                                shutil.copyfileobj(
+                                    CallbackIOWrapper(
+                                        _wire_progress(response.raw, pbar.update),
+                                        response.raw,
+                                        "read",
+                                    ),
+                                    f,
+                                    DOWNLOAD_CHUNK_SIZE,
+                                )
 
                     return True, (file_path, response.status_code, "Success")
 
@@ -843,6 +1418,7 @@ def download_files(download_map: Dict[str, str], overwrite: bool = False) -> boo
                         delay = base_delay * (2**retries)
                         time.sleep(delay)
                         continue
+                    _discard_partial()
                     return False, (file_path, "Exception", str(e))
 
         future_to_file = {
@@ -888,7 +1464,7 @@ def job_cancel(job_id: str, no_input: bool = False, wait: bool = False) -> Tuple
 
     with Spinner("Cancelling job...") as spinner:
         try:
-            response = requests.post(
+            response = _session().post(
                 f"{ENGINE}/job/cancel/{job_id}",
                 headers=headers,
                 timeout=30,
@@ -921,34 +1497,9 @@ def job_list(include_org: bool = False) -> Tuple[bool, str]:
     Returns:
         A tuple containing a boolean indicating success and a message
     """
-    headers = _get_headers()
-
     params = {"include_org": include_org} if include_org else {}
 
-    response = requests.get(
-        f"{ENGINE}/job/list",
-        params=params,
-        headers=headers,
-        timeout=30,
-    )
-
-    try:
-        result = response.json()
-    except requests.exceptions.JSONDecodeError:
-        return (
-            False,
-            f"Failed to decode server response. Status code: {response.status_code}",
-        )
-
-    if response.status_code != 200:
-        error_msg = result.get(
-            "message", f"Error listing jobs. Status code {response.status_code}"
-        )
-        return False, error_msg
-
-    message = result.get("message")
-
-    return True, message
+    return _get_json("/job/list", params=params, error_prefix="Error listing jobs")
 
 
 async def _ws_operation_async(
@@ -959,6 +1510,7 @@ async def _ws_operation_async(
     success_message: str = "Operation completed successfully",
     error_message: str = "Operation failed",
     unexpected_end_message: str = "Connection ended unexpectedly",
+    ping_interval: float = 20.0,
 ) -> Tuple[bool, str]:
     """
     Unified async helper for WebSocket operations (clusters, NFS, etc.)
@@ -971,6 +1523,7 @@ async def _ws_operation_async(
         success_message: Default message for successful completion
         error_message: Default message for errors
         unexpected_end_message: Message when connection ends unexpectedly
+        ping_interval: Seconds between keepalive pings while waiting on the server
 
     Returns:
         Tuple of (success: bool, message: str)
@@ -979,9 +1532,7 @@ async def _ws_operation_async(
     if not api_key:
         return False, "TENSORPOOL_KEY not found. Please set your API key."
 
-    ws_url = (
-        f"{ENGINE.replace('http://', 'ws://').replace('https://', 'wss://')}{endpoint}"
-    )
+    ws_url = f"{WS_ENGINE}{endpoint}"
 
     status = None
     msg = None
@@ -990,19 +1541,18 @@ async def _ws_operation_async(
 
     try:
         async with websockets.connect(
-            ws_url, ping_interval=5, ping_timeout=10
+            ws_url, ping_interval=ping_interval, ping_timeout=10
         ) as websocket:
             # First message: Send API key
-            await websocket.send(json.dumps({"TENSORPOOL_KEY": api_key}))
+            await websocket.send(_json_dumps({"TENSORPOOL_KEY": api_key}))
 
             # Second message: Send payload if provided
             if payload is not None:
-                await websocket.send(json.dumps(payload))
+                await websocket.send(_json_dumps(payload))
 
             # Process server responses
-            while True:
-                message = await websocket.recv()
-                data = json.loads(message)
+            async for message in websocket:
+                data = _json_loads(message)
 
                 status = data.get("status")
                 msg = data.get("message")
@@ -1024,7 +1574,7 @@ async def _ws_operation_async(
                         spinner.resume()
 
                     # Send user response back to server
-                    await websocket.send(json.dumps({"response": user_response}))
+                    await websocket.send(_json_dumps({"response": user_response}))
                     continue
 
                 if msg:
@@ -1034,9 +1584,14 @@ async def _ws_operation_async(
                         print(msg, flush=True)
 
                 # Break on completion
-                if status in ["success", "error"]:
+                if status in ("success", "error"):
                     break
 
+            if status not in ("success", "error"):
+                # Iteration ends quietly on a clean close, so keep its code for the message below
+                close_code = websocket.close_code
+                close_reason = websocket.close_reason
+
     except websockets.exceptions.ConnectionClosed as e:
         close_code = e.code
         close_reason = e.reason
@@ -1077,6 +1632,32 @@ async def _ws_operation_async(
         return False, final_message
 
 
+def _read_public_key(path: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Read an SSH public key file with one bounded read.
+    Args:
+        path: Path to the public key file
+    Returns:
+        A tuple of (stripped key, None) on success or (None, error message) on failure
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            data = os.read(fd, PUBLIC_KEY_MAX_BYTES + 1)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        return None, str(e)
+
+    if len(data) > PUBLIC_KEY_MAX_BYTES:
+        return None, f"file is larger than {PUBLIC_KEY_MAX_BYTES} bytes, is it a public key?"
+
+    try:
+        return data.strip().decode("utf-8"), None
+    except UnicodeDecodeError:
+        return None, "file is not valid UTF-8 text"
+
+
 def cluster_create(
     identity_file: Optional[str],
     instance_type: str,
@@ -1118,11 +1699,9 @@ def cluster_create(
         if not os.path.exists(ssh_key_path):
             return False, f"SSH key file not found: {ssh_key_path}"
 
-        try:
-            with open(ssh_key_path, "r") as f:
-                ssh_key_content = f.read().strip()
-        except Exception as e:
-            return False, f"Failed to read SSH key: {e}"
+        ssh_key_content, read_error = _read_public_key(ssh_key_path)
+        if read_error:
+            return False, f"Failed to read SSH key: {read_error}"
 
         config_payload["public_keys"] = [ssh_key_content]
 
@@ -1136,7 +1715,7 @@ def cluster_create(
 
     with Spinner("Creating cluster...") as spinner:
         try:
-            response = requests.post(
+            response = _session().post(
                 f"{ENGINE}/cluster/create",
                 json=config_payload,
                 headers=headers,
@@ -1187,7 +1766,7 @@ def cluster_destroy(cluster_id: str, no_input: bool = False, wait: bool = False)
 
     with Spinner("Destroying cluster...") as spinner:
         try:
-            response = requests.delete(
+            response = _session().delete(
                 f"{ENGINE}/cluster/{cluster_id}",
                 headers=headers,
                 timeout=30,
@@ -1228,38 +1807,13 @@ def cluster_list(include_org: bool = False, instances: bool = False) -> Tuple[bo
     Returns:
         A tuple containing a boolean indicating success and a message
     """
-    headers = _get_headers()
-
     params: dict = {}
     if include_org:
         params["include_org"] = True
     if instances:
         params["instances"] = True
 
-    response = requests.get(
-        f"{ENGINE}/cluster/list",
-        params=params,
-        headers=headers,
-        timeout=30,
-    )
-
-    try:
-        result = response.json()
-    except requests.exceptions.JSONDecodeError:
-        return (
-            False,
-            f"Failed to decode server response. Status code: {response.status_code}",
-        )
-
-    if response.status_code != 200:
-        error_msg = result.get(
-            "message", f"Error listing clusters. Status code {response.status_code}"
-        )
-        return False, error_msg
-
-    message = result.get("message")
-
-    return True, message
+    return _get_json("/cluster/list", params=params, error_prefix="Error listing clusters")
 
 
 def cluster_info(cluster_id: str) -> Tuple[bool, str]:
@@ -1273,32 +1827,10 @@ def cluster_info(cluster_id: str) -> Tuple[bool, str]:
     if not cluster_id:
         return False, "Cluster ID is required"
 
-    headers = _get_headers()
-
-    response = requests.get(
-        f"{ENGINE}/cluster/info/{cluster_id}",
-        headers=headers,
-        timeout=30,
+    return _get_json(
+        f"/cluster/info/{cluster_id}", error_prefix="Error getting cluster info"
     )
 
-    try:
-        result = response.json()
-    except requests.exceptions.JSONDecodeError:
-        return (
-            False,
-            f"Failed to decode server response. Status code: {response.status_code}",
-        )
-
-    if response.status_code != 200:
-        error_msg = result.get(
-            "message", f"Error getting cluster info. Status code {response.status_code}"
-        )
-        return False, error_msg
-
-    message = result.get("message", "")
-
-    return True, message
-
 
 def job_info(job_id: str) -> Tuple[bool, str]:
     """
@@ -1311,31 +1843,7 @@ def job_info(job_id: str) -> Tuple[bool, str]:
     if not job_id:
         return False, "Job ID is required"
 
-    headers = _get_headers()
-
-    response = requests.get(
-        f"{ENGINE}/job/info/{job_id}",
-        headers=headers,
-        timeout=30,
-    )
-
-    try:
-        result = response.json()
-    except requests.exceptions.JSONDecodeError:
-        return (
-            False,
-            f"Failed to decode server response. Status code: {response.status_code}",
-        )
-
-    if response.status_code != 200:
-        error_msg = result.get(
-            "message", f"Error getting job info. Status code {response.status_code}"
-        )
-        return False, error_msg
-
-    message = result.get("message", "")
-
-    return True, message
+    return _get_json(f"/job/info/{job_id}", error_prefix="Error getting job info")
 
 
 def ssh_command(
@@ -1352,24 +1860,22 @@ def ssh_command(
     if not instance_id:
         return False, "Instance ID is required"
 
-    headers = _get_headers(content_type="")
-    # Remove Content-Type for this endpoint
-    del headers["Content-Type"]
+    # No Content-Type for this endpoint
+    headers = _get_headers(content_type=None)
 
     try:
-        response = requests.get(
+        response = _session().get(
             f"{ENGINE}/ssh/{instance_id}",
             headers=headers,
-            params={"system": platform.system()},
+            params={"system": _PLATFORM_SYSTEM},
             timeout=30,
         )
     except requests.exceptions.RequestException as e:
         return False, f"Failed to get SSH command: {str(e)}"
 
-    try:
-        result = response.json()
-    except requests.exceptions.JSONDecodeError:
-        return False, f"Malformed server response. Status code: {response.status_code}"
+    result, decode_error = _decode_response_json(response)
+    if decode_error:
+        return False, decode_error
 
     if response.status_code != 200:
         message = result.get(
@@ -1396,9 +1902,18 @@ def ssh_command(
         if ssh_args:
             command_args.extend(ssh_args)
 
+        # Windows has no real exec; os.exec* there spawns a child and exits,
+        # which detaches the interactive session from the console. Run ssh as a
+        # child instead and exit with its status, as exec does on POSIX.
+        if _PLATFORM_SYSTEM == "Windows":
+            try:
+                completed = subprocess.run(command_args)
+            except OSError as e:
+                return False, f"Failed to execute SSH command: {str(e)}"
+            sys.exit(completed.returncode)
+
         try:
-            os.execvpe(command_args[0], command_args, os.environ.copy())
-            return True, ""
+            os.execvp(command_args[0], command_args)
         except OSError as e:
             return False, f"Failed to execute SSH command: {str(e)}"
     else:
@@ -1411,33 +1926,12 @@ def fetch_user_info() -> Tuple[bool, str]:
     Returns:
         A tuple containing a boolean indicating success and a message
     """
-    headers = _get_headers(content_type="")
-    # Remove Content-Type for this endpoint
-    del headers["Content-Type"]
-
-    try:
-        response = requests.get(
-            f"{ENGINE}/user/info",
-            headers=headers,
-            timeout=30,
-        )
-    except requests.exceptions.RequestException as e:
-        return False, f"Failed to fetch user info: {str(e)}"
-
-    try:
-        result = response.json()
-    except requests.exceptions.JSONDecodeError:
-        return False, f"Malformed server response. Status code: {response.status_code}"
-
-    if response.status_code != 200:
-        message = result.get(
-            "message",
-            f"Error fetching user information. Status code: {response.status_code}",
-        )
-        return False, message
-
-    message = result.get("message", "")
-    return True, message
+    # No Content-Type for this endpoint
+    return _get_json(
+        "/user/info",
+        headers=_get_headers(content_type=None),
+        error_prefix="Error fetching user information",
+    )
 
 
 def storage_create(
@@ -1465,7 +1959,7 @@ def storage_create(
 
     with Spinner("Creating storage volume...") as spinner:
         try:
-            response = requests.post(
+            response = _session().post(
                 f"{ENGINE}/storage/create",
                 json=payload,
                 headers=headers,
@@ -1523,7 +2017,7 @@ def storage_destroy(storage_id: str, no_input: bool = False, wait: bool = False)
 
     with Spinner("Destroying storage volume...") as spinner:
         try:
-            response = requests.delete(
+            response = _session().delete(
                 f"{ENGINE}/storage/{storage_id}",
                 headers=headers,
                 timeout=30,
@@ -1581,7 +2075,7 @@ def storage_attach(
 
     with Spinner("Attaching storage volume...") as spinner:
         try:
-            response = requests.post(
+            response = _session().post(
                 f"{ENGINE}/storage/attach",
                 json=payload,
                 headers=headers,
@@ -1641,7 +2135,7 @@ def storage_detach(
 
     with Spinner("Detaching storage volume...") as spinner:
         try:
-            response = requests.post(
+            response = _session().post(
                 f"{ENGINE}/storage/detach",
                 json=payload,
                 headers=headers,
@@ -1682,34 +2176,11 @@ def storage_list(include_org: bool = False) -> Tuple[bool, str]:
     Returns:
         A tuple containing a boolean indicating success and a message
     """
-    headers = _get_headers()
-
-    # Add org parameter to request
     params = {"include_org": include_org} if include_org else {}
 
-    try:
-        response = requests.get(
-            f"{ENGINE}/storage/list",
-            params=params,
-            headers=headers,
-            timeout=30,
-        )
-    except requests.exceptions.RequestException as e:
-        return False, f"Failed to list storage volumes: {str(e)}"
-
-    try:
-        result = response.json()
-    except requests.exceptions.JSONDecodeError:
-        return False, f"Malformed server response. Status code: {response.status_code}"
-
-    if response.status_code != 200:
-        message = result.get(
-            "message", f"Error listing storage volumes. Status code: {response.status_code}"
-        )
-        return False, message
-
-    message = result.get("message", "")
-    return True, message
+    return _get_json(
+        "/storage/list", params=params, error_prefix="Error listing storage volumes"
+    )
 
 
 def storage_info(storage_id: str) -> Tuple[bool, str]:
@@ -1723,35 +2194,9 @@ def storage_info(storage_id: str) -> Tuple[bool, str]:
     if not storage_id:
         return False, "Storage ID is required"
 
-    headers = _get_headers()
-
-    try:
-        response = requests.get(
-            f"{ENGINE}/storage/info/{storage_id}",
-            headers=headers,
-            timeout=30,
-        )
-    except requests.exceptions.RequestException as e:
-        return False, f"Failed to get storage volume info: {str(e)}"
-
-    try:
-        result = response.json()
-    except requests.exceptions.JSONDecodeError:
-        return (
-            False,
-            f"Failed to decode server response. Status code: {response.status_code}",
-        )
-
-    if response.status_code != 200:
-        error_msg = result.get(
-            "message",
-            f"Error getting storage volume info. Status code {response.status_code}",
-        )
-        return False, error_msg
-
-    message = result.get("message", "")
-
-    return True, message
+    return _get_json(
+        f"/storage/info/{storage_id}", error_prefix="Error getting storage volume info"
+    )
 
 
 def cluster_edit(
@@ -1771,6 +2216,9 @@ def cluster_edit(
     if not cluster_id:
         return False, "Cluster ID is required"
 
+    if name is None and deletion_protection is None:
+        return False, "No properties specified to edit. Provide --name and/or --deletion-protection."
+
     payload = {}
 
     if name is not None:
@@ -1778,13 +2226,10 @@ def cluster_edit(
     if deletion_protection is not None:
         payload["deletion_protection"] = deletion_protection
 
-    if len(payload) == 0:
-        return False, "No properties specified to edit. Provide --name and/or --deletion-protection."
-
     headers = _get_headers()
 
     try:
-        response = requests.patch(
+        response = _session().patch(
             f"{ENGINE}/cluster/edit/{cluster_id}",
             json=payload,
             headers=headers,
@@ -1793,13 +2238,9 @@ def cluster_edit(
     except requests.exceptions.RequestException as e:
         return False, f"Failed to edit cluster: {str(e)}"
 
-    try:
-        result = response.json()
-    except requests.exceptions.JSONDecodeError:
-        return (
-            False,
-            f"Failed to decode server response. Status code: {response.status_code}",
-        )
+    result, decode_error = _decode_response_json(response)
+    if decode_error:
+        return False, decode_error
 
     if response.status_code != 202:
         error_msg = result.get(
@@ -1830,7 +2271,8 @@ def storage_edit(
     if not storage_id:
         return False, "Storage ID is required"
 
-    headers = _get_headers()
+    if name is None and deletion_protection is None and size is None:
+        return False, "No properties specified to edit. Provide --name, --deletion-protection, and/or --size."
 
     payload = {}
 
@@ -1841,11 +2283,10 @@ def storage_edit(
     if size is not None:
         payload["size_gb"] = size
 
-    if len(payload) == 0:
-        return False, "No properties specified to edit. Provide --name, --deletion-protection, and/or --size."
+    headers = _get_headers()
 
     try:
-        response = requests.patch(
+        response = _session().patch(
             f"{ENGINE}/storage/edit/{storage_id}",
             json=payload,
             headers=headers,
@@ -1854,13 +2295,9 @@ def storage_edit(
     except requests.exceptions.RequestException as e:
         return False, f"Failed to edit storage volume: {str(e)}"
 
-    try:
-        result = response.json()
-    except requests.exceptions.JSONDecodeError:
-        return (
-            False,
-            f"Failed to decode server response. Status code: {response.status_code}",
-        )
+    result, decode_error = _decode_response_json(response)
+    if decode_error:
+        return False, decode_error
 
     if response.status_code != 202:
         error_msg = result.get(
@@ -1872,6 +2309,70 @@ def storage_edit(
     return True, message
 
 
+# Helpers that draw a Spinner or progress bar, prompt on stdin, or take over the
+# terminal; several of them running on worker threads would garble or block the TTY
+_UNBATCHABLE_OPS: Final = frozenset(
+    {
+        login,
+        job_listen,
+        job_push,
+        job_pull,
+        job_cancel,
+        download_files,
+        cluster_create,
+        cluster_destroy,
+        ssh_command,
+        storage_create,
+        storage_destroy,
+        storage_attach,
+        storage_detach,
+    }
+)
+
+
+def batch_ops(
+    ops: List[Tuple[Callable[..., Tuple[bool, str]], Dict]],
+) -> List[Tuple[bool, str]]:
+    """
+    Run independent, non-interactive helper calls concurrently, e.g. fetching
+    info for or renaming several clusters, so they cost about one round trip
+    instead of one per call. At most TENSORPOOL_MAX_CONCURRENCY (default 8) ops
+    run at once, so large batches do not trip the engine's rate limits.
+    Args:
+        ops: (helper, kwargs) pairs, e.g. [(cluster_edit, {"cluster_id": "c-1", "name": "a"})]
+    Returns:
+        A (success, message) tuple per op, in the same order as ops.
+        Exceptions raised by a helper are returned as failures.
+    Raises:
+        ValueError: If any helper prompts or draws a spinner (see _UNBATCHABLE_OPS);
+            nothing is run in that case.
+    """
+    for fn, _ in ops:
+        if fn in _UNBATCHABLE_OPS:
+            raise ValueError(f"{fn.__name__} is interactive and cannot be batched")
+
+    def _run_op(op):
+        fn, kwargs = op
+        try:
+            return fn(**kwargs)
+        except Exception as e:
+            return False, f"{getattr(fn, '__name__', 'operation')} failed: {str(e)}"
+
+    if not ops:
+        return []
+
+    try:
+        max_workers = int(
+            os.environ.get("TENSORPOOL_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)
+        )
+    except ValueError:
+        max_workers = DEFAULT_MAX_CONCURRENCY
+    max_workers = max(1, min(max_workers, len(ops)))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_run_op, ops))
+
+
 # ---------------------------------------------------------------------------
 # Object storage helpers
 # ---------------------------------------------------------------------------
@@ -1886,7 +2387,7 @@ def object_storage_enable() -> Tuple[bool, str]:
     headers = _get_headers()
 
     try:
-        response = requests.post(
+        response = _session().post(
             f"{ENGINE}/object-storage/enable",
             headers=headers,
             timeout=30,
@@ -1924,7 +2425,7 @@ def object_storage_disable() -> Tuple[bool, str]:
     headers = _get_headers()
 
     try:
-        response = requests.delete(
+        response = _session().delete(
             f"{ENGINE}/object-storage/disable",
             headers=headers,
             timeout=30,
@@ -1953,7 +2454,7 @@ def object_storage_credentials() -> Tuple[bool, str]:
     headers = _get_headers()
 
     try:
-        response = requests.get(
+        response = _session().get(
             f"{ENGINE}/object-storage/credentials",
             headers=headers,
             timeout=30,
@@ -1987,8 +2488,6 @@ def _upsert_ini_section(path: str, section_name: str, section_text: str) -> None
     the old block is replaced in-place; otherwise the new section is appended.
     Parent directories are created automatically.
     """
-    import re
-
     os.makedirs(os.path.dirname(path), exist_ok=True)
 
     section_text = section_text.rstrip("\n") + "\n"
@@ -2024,7 +2523,7 @@ def object_storage_configure_aws() -> Tuple[bool, str]:
     headers = _get_headers()
 
     try:
-        response = requests.get(
+        response = _session().get(
             f"{ENGINE}/object-storage/configure/aws",
             headers=headers,
             timeout=30,
@@ -2076,7 +2575,7 @@ def object_storage_configure_rclone() -> Tuple[bool, str]:
     headers = _get_headers()
 
     try:
-        response = requests.get(
+        response = _session().get(
             f"{ENGINE}/object-storage/configure/rclone",
             headers=headers,
             timeout=30,
@@ -2112,7 +2611,7 @@ def object_storage_bucket_list() -> Tuple[bool, str]:
     headers = _get_headers()
 
     try:
-        response = requests.get(
+        response = _session().get(
             f"{ENGINE}/object-storage/bucket/list",
             headers=headers,
             timeout=30,
@@ -2146,7 +2645,7 @@ def object_storage_bucket_create(bucket_name: str) -> Tuple[bool, str]:
     headers = _get_headers()
 
     try:
-        response = requests.put(
+        response = _session().put(
             f"{ENGINE}/object-storage/bucket/create/{bucket_name}",
             headers=headers,
             timeout=30,
@@ -2177,7 +2676,7 @@ def object_storage_bucket_delete(bucket_name: str) -> Tuple[bool, str]:
     headers = _get_headers()
 
     try:
-        response = requests.delete(
+        response = _session().delete(
             f"{ENGINE}/object-storage/bucket/delete/{bucket_name}",
             headers=headers,
             timeout=30,
@@ -2212,7 +2711,7 @@ def job_delete(job_id: str, no_input: bool = False) -> Tuple[bool, str]:
     headers = _get_headers()
 
     try:
-        response = requests.delete(
+        response = _session().delete(
             f"{ENGINE}/job/delete/{job_id}",
             headers=headers,
             timeout=30,
@@ -2220,13 +2719,9 @@ def job_delete(job_id: str, no_input: bool = False) -> Tuple[bool, str]:
     except requests.exceptions.RequestException as e:
         return False, f"Failed to delete job: {str(e)}"
 
-    try:
-        result = response.json()
-    except requests.exceptions.JSONDecodeError:
-        return (
-            False,
-            f"Failed to decode server response. Status code: {response.status_code}",
-        )
+    result, decode_error = _decode_response_json(response)
+    if decode_error:
+        return False, decode_error
 
     if response.status_code != 200:
         error_msg = result.get(
@@ -2262,11 +2757,9 @@ def ssh_key_create(key_path: str, name: Optional[str] = None) -> Tuple[bool, str
         return False, f"Path is not a file: {key_path}"
 
     # Read the public key
-    try:
-        with open(key_path, "r") as f:
-            public_key = f.read().strip()
-    except IOError as e:
-        return False, f"Failed to read SSH key file: {str(e)}"
+    public_key, read_error = _read_public_key(key_path)
+    if read_error:
+        return False, f"Failed to read SSH key file: {read_error}"
 
     if not public_key:
         return False, "SSH key file is empty"
@@ -2278,7 +2771,7 @@ def ssh_key_create(key_path: str, name: Optional[str] = None) -> Tuple[bool, str
         payload["name"] = name
 
     try:
-        response = requests.post(
+        response = _session().post(
             f"{ENGINE}/user/ssh-key/add",
             json=payload,
             headers=headers,
@@ -2287,13 +2780,9 @@ def ssh_key_create(key_path: str, name: Optional[str] = None) -> Tuple[bool, str
     except requests.exceptions.RequestException as e:
         return False, f"Failed to add SSH key: {str(e)}"
 
-    try:
-        result = response.json()
-    except requests.exceptions.JSONDecodeError:
-        return (
-            False,
-            f"Failed to decode server response. Status code: {response.status_code}",
-        )
+    result, decode_error = _decode_response_json(response)
+    if decode_error:
+        return False, decode_error
 
     if response.status_code != 200:
         error_msg = result.get(
@@ -2315,35 +2804,11 @@ def ssh_key_list(include_org: bool = False) -> Tuple[bool, str]:
     Returns:
         A tuple containing a boolean indicating success and a message
     """
-    headers = _get_headers()
     params = {"include_org": include_org} if include_org else {}
 
-    try:
-        response = requests.get(
-            f"{ENGINE}/user/ssh-key/list",
-            headers=headers,
-            params=params,
-            timeout=30,
-        )
-    except requests.exceptions.RequestException as e:
-        return False, f"Failed to list SSH keys: {str(e)}"
-
-    try:
-        result = response.json()
-    except requests.exceptions.JSONDecodeError:
-        return (
-            False,
-            f"Failed to decode server response. Status code: {response.status_code}",
-        )
-
-    if response.status_code != 200:
-        error_msg = result.get(
-            "message", f"Error listing SSH keys. Status code: {response.status_code}"
-        )
-        return False, error_msg
-
-    message = result.get("message", "")
-    return True, message
+    return _get_json(
+        "/user/ssh-key/list", params=params, error_prefix="Error listing SSH keys"
+    )
 
 
 def ssh_key_destroy(key_id: str) -> Tuple[bool, str]:
@@ -2362,7 +2827,7 @@ def ssh_key_destroy(key_id: str) -> Tuple[bool, str]:
     headers = _get_headers()
 
     try:
-        response = requests.delete(
+        response = _session().delete(
             f"{ENGINE}/user/ssh-key/remove/{key_id}",
             headers=headers,
             timeout=30,
@@ -2370,13 +2835,9 @@ def ssh_key_destroy(key_id: str) -> Tuple[bool, str]:
     except requests.exceptions.RequestException as e:
         return False, f"Failed to remove SSH key: {str(e)}"
 
-    try:
-        result = response.json()
-    except requests.exceptions.JSONDecodeError:
-        return (
-            False,
-            f"Failed to decode server response. Status code: {response.status_code}",
-        )
+    result, decode_error = _decode_response_json(response)
+    if decode_error:
+        return False, decode_error
 
     if response.status_code != 200:
         error_msg = result.get(
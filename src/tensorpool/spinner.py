@@ -25,19 +25,18 @@ class Spinner:
         self._stream = sys.stdout
         self.is_tty = self._stream.isatty()
         self.max_text_length = len(text)
+        self._spinner_width = max(len(frame) for frame in spin_chars)
 
     def _spin(self):
         for char in itertools.cycle(self.spin_chars):
             if not self.spinning:
                 break
             if self.is_tty:
-                # Clear the line first
-                max_spinner_width = max(len(frame) for frame in self.spin_chars)
+                # Clear the line and draw the new frame in a single write
                 self._stream.write(
-                    f"\r{' ' * (max_spinner_width + self.max_text_length + 1)}\r"
+                    f"\r{' ' * (self._spinner_width + self.max_text_length + 1)}\r"
+                    f"{char} {self.text}"
                 )
-                # Write the new content
-                self._stream.write(f"{char} {self.text}")
                 self._stream.flush()
             time.sleep(0.213)
 
@@ -58,6 +57,8 @@ class Spinner:
 
     def update_text(self, new_text: str):
         """Update the spinner text while it's running"""
+        if new_text == self.text:
+            return
         self.text = new_text
         # Track the maximum text length for proper cleanup
         self.max_text_length = max(self.max_text_length, len(new_text))
@@ -73,10 +74,9 @@ class Spinner:
 
         if self.is_tty:
             # Clear the current spinner line
-            self._stream.write("\r")
-            max_spinner_width = max(len(frame) for frame in self.spin_chars)
-            self._stream.write(" " * (max_spinner_width + self.max_text_length + 1))
-            self._stream.write("\r")
+            self._stream.write(
+                f"\r{' ' * (self._spinner_width + self.max_text_length + 1)}\r"
+            )
             self._stream.flush()
 
     def resume(self):
@@ -93,9 +93,8 @@ class Spinner:
         if self.spinner_thread:
             self.spinner_thread.join()
         if self.is_tty:
-            self._stream.write("\r")
             # Account for maximum spinner width + maximum text length + spacing
-            max_spinner_width = max(len(frame) for frame in self.spin_chars)
-            self._stream.write(" " * (max_spinner_width + self.max_text_length + 1))
-            self._stream.write("\r")
+            self._stream.write(
+                f"\r{' ' * (self._spinner_width + self.max_text_length + 1)}\r"
+            )
             self._stream.flush()
@@ -0,0 +1,69 @@
+import threading
+import time
+
+import pytest
+
+from tensorpool import helpers
+
+
+def _echo(value, delay=0.0):
+    time.sleep(delay)
+    return True, value
+
+
+def _boom():
+    raise RuntimeError("kaput")
+
+
+def test_results_keep_op_order():
+    ops = [(_echo, {"value": str(i), "delay": 0.05 * (5 - i)}) for i in range(5)]
+
+    assert helpers.batch_ops(ops) == [(True, str(i)) for i in range(5)]
+
+
+def test_exceptions_become_failures():
+    results = helpers.batch_ops([(_echo, {"value": "a"}), (_boom, {})])
+
+    assert results == [(True, "a"), (False, "_boom failed: kaput")]
+
+
+def test_empty_batch():
+    assert helpers.batch_ops([]) == []
+
+
+@pytest.mark.parametrize("env, cap", [("2", 2), (None, 8), ("junk", 8)])
+def test_concurrency_is_capped(monkeypatch, env, cap):
+    if env is None:
+        monkeypatch.delenv("TENSORPOOL_MAX_CONCURRENCY", raising=False)
+    else:
+        monkeypatch.setenv("TENSORPOOL_MAX_CONCURRENCY", env)
+
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def _tracked():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return True, ""
+
+    helpers.batch_ops([(_tracked, {})] * 20)
+
+    assert peak == cap
+
+
+@pytest.mark.parametrize(
+    "fn", [helpers.cluster_destroy, helpers.storage_attach, helpers.job_cancel]
+)
+def test_interactive_helpers_are_rejected(fn):
+    ran = []
+
+    with pytest.raises(ValueError, match="cannot be batched"):
+        helpers.batch_ops([(lambda: ran.append(1) or (True, ""), {}), (fn, {})])
+
+    assert ran == []
@@ -0,0 +1,162 @@
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from tensorpool import helpers
+
+BODY = bytes(range(256)) * 64
+GZIPPED = gzip.compress(BODY)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    unavailable_hits = 0
+
+    def do_GET(self):
+        if self.path == "/unavailable":
+            type(self).unavailable_hits += 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if self.path == "/gzip":
+            self.send_response(200)
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(GZIPPED)))
+            self.end_headers()
+            self.wfile.write(GZIPPED)
+            return
+
+        if self.path == "/truncated":
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY[:10])
+            self.close_connection = True
+            return
+
+        byte_range = self.headers.get("Range")
+        if self.path == "/ranged" and byte_range:
+            start, end = (int(x) for x in byte_range.split("=")[1].split("-"))
+            chunk = BODY[start : end + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(BODY)}")
+        else:
+            # /ignore-range advertises ranges but always answers with the whole body
+            chunk = BODY
+            self.send_response(200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(chunk)))
+        self.end_headers()
+        self.wfile.write(chunk)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(helpers, "RANGED_DOWNLOAD_THRESHOLD", 1)
+    monkeypatch.setattr(helpers.time, "sleep", lambda _: None)
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("path", ["/ranged", "/ignore-range"])
+def test_download_ranged_or_fallback(server_url, tmp_path, path):
+    target = tmp_path / "out.bin"
+
+    assert helpers.download_files({str(target): server_url + path})
+    assert target.read_bytes() == BODY
+
+
+def test_failed_download_leaves_no_file(server_url, tmp_path):
+    target = tmp_path / "out.bin"
+
+    assert not helpers.download_files({str(target): server_url + "/truncated"})
+    assert not target.exists()
+
+
+def test_progress_counts_wire_bytes_for_encoded_responses(
+    server_url, tmp_path, monkeypatch
+):
+    bars = []
+
+    class _RecordingBar(helpers.tqdm):
+        def __exit__(self, *args):
+            bars.append((self.n, self.total))
+            return super().__exit__(*args)
+
+    monkeypatch.setattr(helpers, "tqdm", _RecordingBar)
+    monkeypatch.setattr(helpers, "_progress_enabled", lambda: True)
+    target = tmp_path / "out.bin"
+
+    assert helpers.download_files({str(target): server_url + "/gzip"})
+    assert target.read_bytes() == BODY
+    assert bars == [(len(GZIPPED), len(GZIPPED))]
+
+
+def test_status_errors_are_retried_only_by_the_session(server_url, tmp_path):
+    _Handler.unavailable_hits = 0
+    target = tmp_path / "out.bin"
+
+    assert not helpers.download_files({str(target): server_url + "/unavailable"})
+    # One request plus the session adapter's three status retries
+    assert _Handler.unavailable_hits == 4
+    assert not target.exists()
+
+
+@pytest.mark.parametrize("files, concurrency, parts", [(1, "16", 8), (16, "16", 2)])
+def test_range_parts_shrink_with_concurrent_files(
+    server_url, tmp_path, monkeypatch, files, concurrency, parts
+):
+    monkeypatch.setenv("TENSORPOOL_DOWNLOAD_CONCURRENCY", concurrency)
+    seen = []
+    real_download_ranges = helpers._download_file_ranges
+
+    def _recording(*args, parts):
+        seen.append(parts)
+        return real_download_ranges(*args, parts=parts)
+
+    monkeypatch.setattr(helpers, "_download_file_ranges", _recording)
+    download_map = {
+        str(tmp_path / f"out{i}.bin"): server_url + "/ranged" for i in range(files)
+    }
+
+    assert helpers.download_files(download_map)
+    assert seen == [parts] * files
+    assert all(open(p, "rb").read() == BODY for p in download_map)
+
+
+def test_no_ranged_download_when_the_pool_is_saturated(
+    server_url, tmp_path, monkeypatch
+):
+    monkeypatch.setenv("TENSORPOOL_DOWNLOAD_CONCURRENCY", str(helpers.HTTP_POOL_MAXSIZE))
+    monkeypatch.setattr(helpers, "_download_file_ranges", None)
+    download_map = {
+        str(tmp_path / f"out{i}.bin"): server_url + "/ranged"
+        for i in range(helpers.HTTP_POOL_MAXSIZE)
+    }
+
+    assert helpers.download_files(download_map)
+
+
+def test_ranged_progress_reaches_total(server_url, tmp_path, monkeypatch):
+    bars = []
+
+    class _RecordingBar(helpers.tqdm):
+        def __exit__(self, *args):
+            bars.append((self.n, self.total))
+            return super().__exit__(*args)
+
+    monkeypatch.setattr(helpers, "tqdm", _RecordingBar)
+    monkeypatch.setattr(helpers, "_progress_enabled", lambda: True)
+
+    assert helpers.download_files({str(tmp_path / "out.bin"): server_url + "/ranged"})
+    assert bars == [(len(BODY), len(BODY))]
@@ -0,0 +1,84 @@
+import time
+
+import pytest
+import requests
+
+from tensorpool import helpers
+
+
+class _FakeSession:
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        if self.fail:
+            raise requests.exceptions.ConnectionError("engine down")
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        auth = kwargs["headers"]["Authorization"]
+        response._content = (
+            b'{"empty_tp_config": {"for": "' + auth.encode() + b'"}, "message": "ok"}'
+        )
+        return response
+
+
+@pytest.fixture
+def session(tmp_path, monkeypatch):
+    fake = _FakeSession()
+    monkeypatch.setattr(helpers, "_session", lambda: fake)
+    monkeypatch.setattr(
+        helpers, "_EMPTY_TP_CONFIG_CACHE", str(tmp_path / "empty_tp_config.json")
+    )
+    monkeypatch.setattr(helpers, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("TENSORPOOL_KEY", "key-a")
+    return fake
+
+
+def test_fresh_cache_is_reused(session):
+    first = helpers.get_empty_tp_config()
+    second = helpers.get_empty_tp_config()
+
+    assert first == second == (True, {"for": "Bearer key-a"}, "ok")
+    assert session.calls == 1
+
+
+def test_cache_hit_still_requires_a_key(session, monkeypatch):
+    helpers.get_empty_tp_config()
+    monkeypatch.delenv("TENSORPOOL_KEY")
+    monkeypatch.setattr(helpers, "_read_env_file_key", lambda: None)
+
+    with pytest.raises(AssertionError, match="TENSORPOOL_KEY not found"):
+        helpers.get_empty_tp_config()
+
+
+def test_cache_is_not_shared_between_keys(session, monkeypatch):
+    helpers.get_empty_tp_config()
+    monkeypatch.setenv("TENSORPOOL_KEY", "key-b")
+
+    assert helpers.get_empty_tp_config()[1] == {"for": "Bearer key-b"}
+    assert session.calls == 2
+
+
+@pytest.mark.parametrize(
+    "age, served",
+    [
+        (helpers._EMPTY_TP_CONFIG_TTL + 1, True),
+        (helpers._EMPTY_TP_CONFIG_MAX_STALE + 1, False),
+    ],
+)
+def test_stale_fallback_is_capped(session, monkeypatch, age, served):
+    helpers.get_empty_tp_config()
+    session.fail = True
+    now = time.time()
+    monkeypatch.setattr(helpers.time, "time", lambda: now + age)
+
+    success, config, message = helpers.get_empty_tp_config()
+
+    assert success is served
+    if served:
+        assert message == "Could not reach TensorPool, using cached config"
+    else:
+        assert message.startswith("Failed to fetch empty config")
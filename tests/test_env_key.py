@@ -0,0 +1,83 @@
+import pytest
+
+from tensorpool import helpers
+
+
+@pytest.fixture
+def env_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("TENSORPOOL_KEY", raising=False)
+    helpers._invalidate_key_cache()
+    yield tmp_path
+    helpers._invalidate_key_cache()
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "TENSORPOOL_KEY=\nOTHER=1\n",
+        'TENSORPOOL_KEY=""\nOTHER=1\n',
+        "TENSORPOOL_KEY = \nOTHER=1\n",
+        "TENSORPOOL_KEY_V2=abc\nOTHER=1\n",
+    ],
+)
+def test_blank_or_other_key_lines_yield_no_key(env_dir, content):
+    (env_dir / ".env").write_text(content)
+    assert helpers.get_tensorpool_key() is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "TENSORPOOL_KEY=abc\n",
+        'TENSORPOOL_KEY="abc"\n',
+        "TENSORPOOL_KEY = 'abc'\r\n",
+        "TENSORPOOL_KEY_V2=zzz\nTENSORPOOL_KEY=abc\n",
+    ],
+)
+def test_key_is_read_from_env_file(env_dir, content):
+    (env_dir / ".env").write_text(content)
+    assert helpers.get_tensorpool_key() == "abc"
+
+
+@pytest.mark.parametrize(
+    "existing",
+    [
+        "TENSORPOOL_KEY=\nOTHER=1\n",
+        'TENSORPOOL_KEY=""\nOTHER=1\n',
+        "TENSORPOOL_KEY=old\nOTHER=1\n",
+    ],
+)
+def test_save_replaces_every_key_line(env_dir, monkeypatch, existing):
+    (env_dir / ".env").write_text(existing + "TENSORPOOL_KEY_V2=keep\n")
+
+    assert helpers.save_tensorpool_key("new")
+
+    lines = (env_dir / ".env").read_text().splitlines()
+    assert lines == ["OTHER=1", "TENSORPOOL_KEY_V2=keep", "TENSORPOOL_KEY=new"]
+
+    # A fresh process only has the file to go on
+    monkeypatch.delenv("TENSORPOOL_KEY")
+    helpers._invalidate_key_cache()
+    assert helpers.get_tensorpool_key() == "new"
+
+
+def test_failed_save_leaves_no_temp_file(env_dir, monkeypatch):
+    (env_dir / ".env").write_text("OTHER=1\n")
+    real_tempfile = helpers.tempfile.NamedTemporaryFile
+
+    def _disk_full(*args, **kwargs):
+        f = real_tempfile(*args, **kwargs)
+
+        def _write(data):
+            f.file.write(data[:5])
+            raise OSError(28, "No space left on device")
+
+        f.write = _write
+        return f
+
+    monkeypatch.setattr(helpers.tempfile, "NamedTemporaryFile", _disk_full)
+
+    assert not helpers.save_tensorpool_key("secret-key")
+    assert sorted(p.name for p in env_dir.iterdir()) == [".env"]
+    assert (env_dir / ".env").read_text() == "OTHER=1\n"
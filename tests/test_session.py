@@ -0,0 +1,38 @@
+import threading
+import time
+
+from tensorpool import helpers
+
+
+def test_session_does_not_retry_read_timeouts():
+    retry = helpers._session().get_adapter("https://example.com").max_retries
+
+    assert retry.read == 0
+    assert retry.total == 3
+    assert set(retry.status_forcelist) == {502, 503, 504}
+
+
+def test_concurrent_first_use_builds_one_session(monkeypatch):
+    monkeypatch.setattr(helpers, "_SESSION", None)
+    real_session = helpers.requests.Session
+
+    def _slow_session():
+        # Widen the window between the None check and the assignment
+        time.sleep(0.05)
+        return real_session()
+
+    monkeypatch.setattr(helpers.requests, "Session", _slow_session)
+    barrier = threading.Barrier(8)
+    sessions = []
+
+    def _grab():
+        barrier.wait()
+        sessions.append(helpers._session())
+
+    threads = [threading.Thread(target=_grab) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len({id(s) for s in sessions}) == 1